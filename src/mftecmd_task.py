@@ -1,16 +1,114 @@
 import base64
-import copy
 import csv
-import io
+import functools
 import json
+import operator
 import os
+import re
 import shlex
-from datetime import datetime, timezone
+import shutil
+import tempfile
+from collections.abc import Callable
+from datetime import datetime, timedelta, timezone
 
 from .app import celery
 from .utils import _run_ez_tool
 from openrelik_worker_common.task_utils import encode_dict_to_base64
 
+# Zone.Identifier contents arrive with escaped ("\\r\\n") or raw line breaks.
+_ZONE_NL_RE = re.compile(r"\\r|\\n|\r")
+# Matches "Key=Value" lines, skipping section headers such as "[ZoneTransfer]".
+_ZONE_LINE_RE = re.compile(r"^[^\S\n]*([^=\[\s][^=\n]*)=(.*)$", re.MULTILINE)
+
+# MFTECmd's timestamp layout, e.g. "2024-02-13 16:39:06.1234567".
+_TIMESTAMP_RE = re.compile(
+    r"^(\d{4})-(\d{2})-(\d{2})[ T](\d{2}):(\d{2}):(\d{2})"
+    r"(?:\.(\d{1,7}))?(Z|[+-]\d{2}:?\d{2})?$",
+    re.ASCII,
+)
+
+# Same string encoder json.dumps() uses with its default ensure_ascii=True.
+_json_string = json.encoder.encode_basestring_ascii
+
+# CSV columns already mapped onto dedicated Timesketch fields; everything else
+# is carried over in "extra_attributes".
+_BASE_CONSUMED_KEYS = frozenset(
+    {
+        "EntryNumber",
+        "SequenceNumber",
+        "ParentPath",
+        "Directory",
+        "Path",
+        "FullPath",
+        "FileName",
+        "Name",
+        "Size",
+        "PhysicalSize",
+        "OwnerSID",
+        "Owner",
+        "VolumeName",
+        "DriveLetter",
+        "VolumeSerialNumber",
+        "ZoneIdentifier",
+        "ZoneId",
+        "ZoneID",
+        "ZoneIdContents",
+        "ZoneIdentifierContents",
+    }
+)
+# Zone.Identifier keys already mapped onto dedicated zone_* fields.
+_ZONE_CONSUMED_KEYS = frozenset(
+    {
+        "zoneid",
+        "zone_id",
+        "hosturl",
+        "zonehosturl",
+        "referrerurl",
+        "zonereferrerurl",
+        "url",
+        "sourceurl",
+        "zonetransferurl",
+    }
+)
+
+# Output columns of the Timesketch-ready CSV, in order.
+_TIMESKETCH_FIELDS = (
+    "datetime",
+    "timestamp_desc",
+    "message",
+    "source",
+    "source_short",
+    "source_long",
+    "host",
+    "user",
+    "display_name",
+    "filename",
+    "filepath",
+    "entry_number",
+    "sequence_number",
+    "size",
+    "zone_identifier",
+    "zone_identifier_raw",
+    "zone_id",
+    "zone_host_url",
+    "zone_referrer_url",
+    "zone_source_url",
+    "alternate_data_stream",
+    "extra_attributes",
+)
+_O_DATETIME = _TIMESKETCH_FIELDS.index("datetime")
+_O_DESC = _TIMESKETCH_FIELDS.index("timestamp_desc")
+_O_MESSAGE = _TIMESKETCH_FIELDS.index("message")
+_O_SOURCE = _TIMESKETCH_FIELDS.index("source")
+_O_SOURCE_SHORT = _TIMESKETCH_FIELDS.index("source_short")
+_O_SOURCE_LONG = _TIMESKETCH_FIELDS.index("source_long")
+# Per-record fields from "host" through "alternate_data_stream".
+_O_RECORD = slice(
+    _TIMESKETCH_FIELDS.index("host"),
+    _TIMESKETCH_FIELDS.index("alternate_data_stream") + 1,
+)
+_O_EXTRA = _TIMESKETCH_FIELDS.index("extra_attributes")
+
 # --- MFTECmd Task ---
 MFTECMD_TASK_NAME = "openrelik-worker-eztools.tasks.mftecmd"
 MFTECMD_TASK_METADATA = {
@@ -103,7 +201,10 @@ def mftecmd_command(
         Base64-encoded dictionary containing task results.
     """
     effective_task_config = dict(task_config or {})
-    output_format_config = copy.deepcopy(MFTECMD_OUTPUT_FORMAT_CONFIG)
+    # Values are flat dicts of strings, so copying one level deep is enough.
+    output_format_config = {
+        key: dict(value) for key, value in MFTECMD_OUTPUT_FORMAT_CONFIG.items()
+    }
     # Default to 'csv' if not specified or invalid
     output_format = effective_task_config.get("output_format")
     if output_format not in ("csv", "json", "body"):
@@ -161,25 +262,32 @@ def mftecmd_command(
         and result
     ):
         try:
-            decoded = base64.b64decode(result.encode("utf-8")).decode("utf-8")
-            result_dict = json.loads(decoded)
+            # b64decode accepts the ASCII str and json.loads the UTF-8 bytes
+            # directly, avoiding two extra full copies of the payload.
+            result_dict = json.loads(base64.b64decode(result))
         except (ValueError, json.JSONDecodeError) as exc:
             print(f"Unable to decode MFTECmd task result for Timesketch conversion: {exc}")
             return result
 
+        csv_files = [
+            output_file
+            for output_file in result_dict.get("output_files", [])
+            if (output_file.get("path") or "").lower().endswith(".csv")
+        ]
+        if not csv_files:
+            return result
+
         transformed = False
-        for output_file in result_dict.get("output_files", []):
-            output_path_for_file = output_file.get("path")
-            if not output_path_for_file or not output_path_for_file.lower().endswith(".csv"):
-                continue
-            converted_bytes, event_count = _convert_mftecmd_csv_to_timesketch(output_path_for_file)
-            if not converted_bytes:
+        for output_file in csv_files:
+            output_path_for_file = output_file["path"]
+            converted_path, event_count = _convert_mftecmd_csv_to_timesketch(output_path_for_file)
+            if not converted_path:
                 continue
             try:
-                with open(output_path_for_file, "wb") as fh:
-                    fh.write(converted_bytes)
+                os.replace(converted_path, output_path_for_file)
             except OSError as exc:
                 print(f"Failed writing Timesketch-formatted CSV for MFTECmd: {exc}")
+                _remove_file_quietly(converted_path)
                 continue
 
             original_display_name = output_file.get("display_name") or "mftecmd.csv"
@@ -200,20 +308,26 @@ def mftecmd_command(
     return result
 
 
-def _convert_mftecmd_csv_to_timesketch(csv_path: str) -> tuple[bytes | None, int]:
+def _convert_mftecmd_csv_to_timesketch(csv_path: str) -> tuple[str | None, int]:
     """Convert MFTECmd CSV output into a Timesketch-friendly timeline.
 
+    Rows are streamed to a temporary file next to ``csv_path`` so memory use
+    stays bounded by a single row instead of the whole export. The caller is
+    responsible for moving the temporary file into place.
+
     Args:
         csv_path: Path to the MFTECmd-generated CSV file.
 
     Returns:
-        A tuple containing the converted CSV bytes (or None if conversion
-        could not be performed) and the number of timeline rows generated.
+        A tuple containing the path of the converted CSV file (or None if
+        conversion could not be performed) and the number of timeline rows
+        generated.
     """
+    tmp_path = None
     try:
         with open(csv_path, "r", encoding="utf-8-sig", newline="") as input_fh:
-            reader = csv.DictReader(input_fh)
-            fieldnames = reader.fieldnames or []
+            reader = csv.reader(input_fh)
+            fieldnames = next(reader, None) or []
             timestamp_columns = [
                 name
                 for name in fieldnames
@@ -227,222 +341,216 @@ def _convert_mftecmd_csv_to_timesketch(csv_path: str) -> tuple[bytes | None, int
                 )
                 return None, 0
 
-            output_handle = io.StringIO()
-            timesketch_fields = [
-                "datetime",
-                "timestamp_desc",
-                "message",
-                "source",
-                "source_short",
-                "source_long",
-                "host",
-                "user",
-                "display_name",
-                "filename",
-                "filepath",
-                "entry_number",
-                "sequence_number",
-                "size",
-                "zone_identifier",
-                "zone_identifier_raw",
-                "zone_id",
-                "zone_host_url",
-                "zone_referrer_url",
-                "zone_source_url",
-                "alternate_data_stream",
-                "extra_attributes",
+            # Resolve column positions once so the row loop works on plain lists.
+            column_count = len(fieldnames)
+            idx = {name: i for i, name in enumerate(fieldnames)}
+            i_filename = _column_indices(idx, "FileName", "Name")
+            i_parent = _column_indices(idx, "ParentPath", "Directory", "Path", "FullPath")
+            i_entry = _column_indices(idx, "EntryNumber")
+            i_sequence = _column_indices(idx, "SequenceNumber")
+            i_size = _column_indices(idx, "Size", "PhysicalSize")
+            i_user = _column_indices(idx, "OwnerSID", "Owner")
+            i_zone_id = _column_indices(idx, "ZoneIdentifier", "ZoneId", "ZoneID")
+            i_zone_contents = _column_indices(idx, "ZoneIdContents", "ZoneIdentifierContents")
+            has_zone = bool(i_zone_contents)
+            i_ads = _column_indices(idx, "StreamName", "AlternateDataStream", "ADS")
+            i_host = _column_indices(idx, "VolumeName", "DriveLetter", "VolumeSerialNumber")
+            extra_columns = [
+                (i, name)
+                for i, name in enumerate(fieldnames)
+                if name not in _BASE_CONSUMED_KEYS
             ]
-            writer = csv.DictWriter(output_handle, fieldnames=timesketch_fields)
-            writer.writeheader()
-
-            event_rows = 0
-            for row in reader:
-                if not row:
-                    continue
-
-                filename = (row.get("FileName") or row.get("Name") or "").strip()
-                parent_path = (
-                    row.get("ParentPath")
-                    or row.get("Directory")
-                    or row.get("Path")
-                    or row.get("FullPath")
-                    or ""
-                ).strip()
-                if parent_path and filename:
-                    if parent_path.endswith("\\") or parent_path.endswith("/"):
-                        full_path = f"{parent_path}{filename}"
-                    else:
-                        full_path = f"{parent_path}\\{filename}"
-                else:
-                    full_path = filename or parent_path
-
-                entry_number = (row.get("EntryNumber") or "").strip()
-                sequence_number = (row.get("SequenceNumber") or "").strip()
-                size = (row.get("Size") or row.get("PhysicalSize") or "").strip()
-                user = (row.get("OwnerSID") or row.get("Owner") or "").strip()
-                zone_identifier = (
-                    row.get("ZoneIdentifier")
-                    or row.get("ZoneId")
-                    or row.get("ZoneID")
-                    or ""
-                )
-                zone_contents_raw = (
-                    row.get("ZoneIdContents")
-                    or row.get("ZoneIdentifierContents")
-                    or ""
-                )
-                zone_contents = _parse_zone_identifier_contents(zone_contents_raw)
-                zone_id_value = (
-                    zone_contents.get("zoneid")
-                    or zone_contents.get("zone_id")
-                    or ""
-                )
-                host_url = (
-                    zone_contents.get("hosturl")
-                    or zone_contents.get("zonehosturl")
-                    or zone_contents.get("url")
-                    or ""
-                )
-                referrer_url = (
-                    zone_contents.get("referrerurl")
-                    or zone_contents.get("zonereferrerurl")
-                    or ""
-                )
-                source_url = (
-                    zone_contents.get("sourceurl")
-                    or zone_contents.get("zonetransferurl")
-                    or ""
-                )
-                if not zone_identifier and zone_id_value:
-                    zone_identifier = zone_id_value
-                ads_name = (
-                    row.get("StreamName")
-                    or row.get("AlternateDataStream")
-                    or row.get("ADS")
-                    or ""
-                )
-
-                message_parts = [full_path or "<unknown path>"]
-                if size:
-                    message_parts.append(f"Size: {size}")
-                if entry_number or sequence_number:
-                    message_parts.append(
-                        f"Entry: {entry_number}{':' if sequence_number else ''}{sequence_number}"
-                    )
-                if zone_identifier:
-                    message_parts.append(f"ZoneIdentifier: {zone_identifier}")
-                if ads_name:
-                    message_parts.append(f"ADS: {ads_name}")
-                if host_url:
-                    message_parts.append(f"HostUrl: {host_url}")
-                if referrer_url:
-                    message_parts.append(f"ReferrerUrl: {referrer_url}")
-                message = " | ".join(part for part in message_parts if part)
-
-                hostname = (
-                    row.get("VolumeName")
-                    or row.get("DriveLetter")
-                    or row.get("VolumeSerialNumber")
-                    or ""
-                )
-
-                for column_name in timestamp_columns:
-                    raw_value = row.get(column_name)
-                    if raw_value is None:
+            extra_names = [name for _, name in extra_columns]
+            extra_getter = _row_getter([i for i, _ in extra_columns])
+            extra_keys_json = [f"{_json_string(name)}: " for name in extra_names]
+            ts_descriptions = {
+                name: _describe_mft_timestamp(name) for name in timestamp_columns
+            }
+            ts_getter = _row_getter([idx[name] for name in timestamp_columns])
+            ts_meta = [(name, ts_descriptions[name]) for name in timestamp_columns]
+
+            tmp_fd, tmp_path = tempfile.mkstemp(
+                prefix=".timesketch_",
+                suffix=".csv",
+                dir=os.path.dirname(os.path.abspath(csv_path)),
+            )
+            # Wrap the descriptor straight away so it is closed on any failure.
+            with open(
+                tmp_fd, "w", encoding="utf-8", newline="", buffering=1 << 20
+            ) as output_handle:
+                try:
+                    shutil.copymode(csv_path, tmp_path)
+                except OSError:
+                    # Some mounts reject chmod; the temp file's own mode will do.
+                    pass
+                writer = csv.writer(output_handle)
+                writer.writerow(_TIMESKETCH_FIELDS)
+
+                # Reused for every event; csv.writer copies the values out.
+                row_out = [""] * len(_TIMESKETCH_FIELDS)
+                row_out[_O_SOURCE] = "MFTECmd"
+                row_out[_O_SOURCE_SHORT] = "$MFT"
+                row_out[_O_SOURCE_LONG] = "MFTECmd $MFT Parser"
+
+                # Bind hot callables to locals to skip attribute/global lookups.
+                writerow = writer.writerow
+                encode_string = _json_string
+                first_value = _first_value
+                normalize_timestamp = _normalize_timestamp
+                empty_timestamps = {"N/A", "NA", "0"}
+
+                event_rows = 0
+                for row in reader:
+                    if not row:
                         continue
-                    value = raw_value.strip()
-                    if not value or value.upper() in {"N/A", "NA", "0"}:
+                    if len(row) < column_count:
+                        row.extend([""] * (column_count - len(row)))
+
+                    # Explode the timestamp columns into events first so rows
+                    # without a usable timestamp skip all per-record work.
+                    events = []
+                    add_event = events.append
+                    for raw_value, (column_name, description) in zip(ts_getter(row), ts_meta):
+                        value = raw_value.strip()
+                        if not value or value.upper() in empty_timestamps:
+                            continue
+                        normalized_datetime = normalize_timestamp(value)
+                        if normalized_datetime:
+                            add_event((normalized_datetime, column_name, description))
+                    if not events:
                         continue
 
-                    description = _describe_mft_timestamp(column_name)
-                    normalized_datetime = _normalize_timestamp(value)
-                    if not normalized_datetime:
-                        continue
-                    consumed_keys = {
-                        "EntryNumber",
-                        "SequenceNumber",
-                        "ParentPath",
-                        "Directory",
-                        "Path",
-                        "FullPath",
-                        "FileName",
-                        "Name",
-                        "Size",
-                        "PhysicalSize",
-                        "OwnerSID",
-                        "Owner",
-                        "VolumeName",
-                        "DriveLetter",
-                        "VolumeSerialNumber",
-                        column_name,
-                        "ZoneIdentifier",
-                        "ZoneId",
-                        "ZoneID",
-                        "ZoneIdContents",
-                        "ZoneIdentifierContents",
-                    }
-                    extra_attributes = {
-                        key: value
-                        for key, value in row.items()
-                        if key not in consumed_keys and value not in (None, "")
-                    }
-                    zone_extra_keys = {
-                        key: value
-                        for key, value in zone_contents.items()
-                        if key
-                        not in {
-                            "zoneid",
-                            "zone_id",
-                            "hosturl",
-                            "zonehosturl",
-                            "referrerurl",
-                            "zonereferrerurl",
-                            "url",
-                            "sourceurl",
-                            "zonetransferurl",
-                        }
-                        and value
-                    }
-                    if zone_extra_keys:
-                        extra_attributes.update(
-                            {f"zone_{key}": value for key, value in zone_extra_keys.items()}
+                    filename = first_value(row, i_filename).strip()
+                    parent_path = first_value(row, i_parent).strip()
+                    if parent_path and filename:
+                        if parent_path.endswith("\\") or parent_path.endswith("/"):
+                            full_path = f"{parent_path}{filename}"
+                        else:
+                            full_path = f"{parent_path}\\{filename}"
+                    else:
+                        full_path = filename or parent_path
+
+                    entry_number = first_value(row, i_entry).strip()
+                    sequence_number = first_value(row, i_sequence).strip()
+                    size = first_value(row, i_size).strip()
+                    user = first_value(row, i_user).strip()
+                    zone_identifier = first_value(row, i_zone_id)
+                    zone_contents_raw = (
+                        first_value(row, i_zone_contents) if has_zone else ""
+                    )
+                    if zone_contents_raw:
+                        zone_contents = _parse_zone_identifier_contents(zone_contents_raw)
+                        zget = zone_contents.get
+                        zone_id_value = (
+                            zget("zoneid")
+                            or zget("zone_id")
+                            or ""
                         )
-
-                    writer.writerow(
-                        {
-                            "datetime": normalized_datetime,
-                            "timestamp_desc": description,
-                            "message": message,
-                            "source": "MFTECmd",
-                            "source_short": "$MFT",
-                            "source_long": "MFTECmd $MFT Parser",
-                            "host": hostname,
-                            "user": user,
-                            "display_name": f"MFTE:{full_path}" if full_path else "MFTECmd",
-                            "filename": filename,
-                            "filepath": full_path,
-                            "entry_number": entry_number,
-                            "sequence_number": sequence_number,
-                            "size": size,
-                            "zone_identifier": zone_identifier,
-                            "zone_identifier_raw": zone_contents_raw,
-                            "zone_id": zone_id_value,
-                            "zone_host_url": host_url,
-                            "zone_referrer_url": referrer_url,
-                            "zone_source_url": source_url,
-                            "alternate_data_stream": ads_name,
-                            "extra_attributes": json.dumps(extra_attributes) if extra_attributes else "",
-                        }
+                        host_url = (
+                            zget("hosturl")
+                            or zget("zonehosturl")
+                            or zget("url")
+                            or ""
+                        )
+                        referrer_url = (
+                            zget("referrerurl")
+                            or zget("zonereferrerurl")
+                            or ""
+                        )
+                        source_url = (
+                            zget("sourceurl")
+                            or zget("zonetransferurl")
+                            or ""
+                        )
+                    else:
+                        zone_contents = {}
+                        zone_id_value = host_url = referrer_url = source_url = ""
+                    if not zone_identifier and zone_id_value:
+                        zone_identifier = zone_id_value
+                    ads_name = first_value(row, i_ads)
+
+                    message_parts = [full_path or "<unknown path>"]
+                    add_part = message_parts.append
+                    if size:
+                        add_part(f"Size: {size}")
+                    if entry_number or sequence_number:
+                        add_part(
+                            f"Entry: {entry_number}{':' if sequence_number else ''}{sequence_number}"
+                        )
+                    if zone_identifier:
+                        add_part(f"ZoneIdentifier: {zone_identifier}")
+                    if ads_name:
+                        add_part(f"ADS: {ads_name}")
+                    if host_url:
+                        add_part(f"HostUrl: {host_url}")
+                    if referrer_url:
+                        add_part(f"ReferrerUrl: {referrer_url}")
+                    message = " | ".join(filter(None, message_parts))
+
+                    hostname = first_value(row, i_host)
+
+                    # Encode each extra attribute as a JSON member once per row;
+                    # events then only join the members, leaving out their own
+                    # timestamp column. This matches json.dumps() of the dict.
+                    extra_members = {
+                        name: key_json + encode_string(value)
+                        for name, key_json, value in zip(
+                            extra_names, extra_keys_json, extra_getter(row)
+                        )
+                        if value
+                    }
+                    if zone_contents:
+                        for key, value in zone_contents.items():
+                            if key not in _ZONE_CONSUMED_KEYS and value:
+                                zone_key = f"zone_{key}"
+                                extra_members[zone_key] = (
+                                    f"{encode_string(zone_key)}: {encode_string(value)}"
+                                )
+                    member_names = list(extra_members)
+                    members = list(extra_members.values())
+
+                    row_out[_O_MESSAGE] = message
+                    row_out[_O_RECORD] = (
+                        hostname,
+                        user,
+                        f"MFTE:{full_path}" if full_path else "MFTECmd",
+                        filename,
+                        full_path,
+                        entry_number,
+                        sequence_number,
+                        size,
+                        zone_identifier,
+                        zone_contents_raw,
+                        zone_id_value,
+                        host_url,
+                        referrer_url,
+                        source_url,
+                        ads_name,
                     )
-                    event_rows += 1
+
+                    for normalized_datetime, column_name, description in events:
+                        # An event's own timestamp is not repeated in its extras.
+                        event_members = members
+                        if column_name in extra_members:
+                            position = member_names.index(column_name)
+                            event_members = members[:position] + members[position + 1:]
+
+                        row_out[_O_DATETIME] = normalized_datetime
+                        row_out[_O_DESC] = description
+                        row_out[_O_EXTRA] = (
+                            f"{{{', '.join(event_members)}}}" if event_members else ""
+                        )
+                        writerow(row_out)
+                        event_rows += 1
 
             if event_rows == 0:
                 print(
                     "MFTECmd Timesketch conversion skipped: no timestamp rows produced after filtering."
                 )
+                _remove_file_quietly(tmp_path)
                 return None, 0
 
-            return output_handle.getvalue().encode("utf-8"), event_rows
+            return tmp_path, event_rows
     except FileNotFoundError:
         print(
             f"MFTECmd Timesketch conversion skipped: file not found at path '{csv_path}'."
@@ -450,9 +558,43 @@ def _convert_mftecmd_csv_to_timesketch(csv_path: str) -> tuple[bytes | None, int
     except Exception as exc:  # pylint: disable=broad-except
         print(f"MFTECmd Timesketch conversion failed: {exc}")
 
+    if tmp_path:
+        _remove_file_quietly(tmp_path)
     return None, 0
 
 
+def _remove_file_quietly(path: str) -> None:
+    """Remove a file, ignoring errors if it is already gone."""
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def _column_indices(column_index: dict[str, int], *names: str) -> tuple[int, ...]:
+    """Return the positions of the given columns that exist in the CSV header."""
+    return tuple(column_index[name] for name in names if name in column_index)
+
+
+def _row_getter(indices: list[int]) -> Callable[[list[str]], tuple[str, ...]]:
+    """Build a C-level gatherer returning the values at ``indices`` as a tuple."""
+    if not indices:
+        return lambda row: ()
+    if len(indices) == 1:
+        index = indices[0]
+        return lambda row: (row[index],)
+    return operator.itemgetter(*indices)
+
+
+def _first_value(row: list[str], indices: tuple[int, ...]) -> str:
+    """Return the first non-empty value found at the given row positions."""
+    for index in indices:
+        value = row[index]
+        if value:
+            return value
+    return ""
+
+
 def _describe_mft_timestamp(column_name: str) -> str:
     """Generate a human-readable description for a timestamp column."""
     lowered = column_name.lower()
@@ -477,12 +619,45 @@ def _describe_mft_timestamp(column_name: str) -> str:
     return f"MFTECmd {attribute} - {action}"
 
 
+@functools.lru_cache(maxsize=4096)
 def _normalize_timestamp(raw_value: str) -> str | None:
-    """Normalize MFTECmd timestamps to Timesketch's expected format."""
+    """Normalize MFTECmd timestamps to Timesketch's expected format.
+
+    Results are cached because neighbouring rows and the $SI/$FN attribute
+    pairs of a record frequently share the exact same timestamp.
+    """
     value = raw_value.strip()
     if not value:
         return None
 
+    match = _TIMESTAMP_RE.match(value)
+    if match:
+        year, month, day, hour, minute, second, _, offset = match.groups()
+        try:
+            if offset and offset != "Z":
+                sign = -1 if offset[0] == "-" else 1
+                tzinfo = timezone(
+                    sign * timedelta(hours=int(offset[1:3]), minutes=int(offset[-2:]))
+                )
+            else:
+                tzinfo = timezone.utc
+            dt_obj = datetime(
+                int(year),
+                int(month),
+                int(day),
+                int(hour),
+                int(minute),
+                int(second),
+                tzinfo=tzinfo,
+            )
+        except ValueError:
+            pass
+        else:
+            if tzinfo is timezone.utc:
+                # Already validated, so the groups can be emitted as-is.
+                return f"{year}-{month}-{day}T{hour}:{minute}:{second}+0000"
+            return dt_obj.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S%z")
+
     parse_formats = [
         "%Y-%m-%d %H:%M:%S.%f",
         "%Y-%m-%d %H:%M:%S",
@@ -519,17 +694,8 @@ def _parse_zone_identifier_contents(raw_value: str) -> dict[str, str]:
     if not raw_value:
         return {}
 
-    normalized = raw_value.strip().strip('"')
-    normalized = normalized.replace("\\r", "\n").replace("\\n", "\n")
-    normalized = normalized.replace("\r", "\n")
-
-    parsed: dict[str, str] = {}
-    for line in normalized.splitlines():
-        stripped = line.strip()
-        if not stripped or stripped.startswith("["):
-            continue
-        if "=" not in stripped:
-            continue
-        key, value = stripped.split("=", 1)
-        parsed[key.strip().lower()] = value.strip()
-    return parsed
+    normalized = _ZONE_NL_RE.sub("\n", raw_value.strip().strip('"'))
+    return {
+        match.group(1).strip().lower(): match.group(2).strip()
+        for match in _ZONE_LINE_RE.finditer(normalized)
+    }
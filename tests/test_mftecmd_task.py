@@ -4,6 +4,7 @@ import base64
 import copy
 import csv
 import json
+import multiprocessing
 import os
 
 import pytest
@@ -158,13 +159,232 @@ def test_mftecmd_zone_identifier_parsing(tmp_path):
     )
     csv_path.write_text(csv_content, encoding="utf-8")
 
-    converted_bytes, count = _convert_mftecmd_csv_to_timesketch(str(csv_path))
+    converted_path, count = _convert_mftecmd_csv_to_timesketch(str(csv_path))
     assert count == 1
+    assert os.path.dirname(converted_path) == str(tmp_path)
 
-    rows = list(csv.DictReader(converted_bytes.decode("utf-8").splitlines()))
+    with open(converted_path, encoding="utf-8", newline="") as fh:
+        rows = list(csv.DictReader(fh))
     assert rows[0]["zone_identifier"] == "3"
     assert rows[0]["zone_id"] == "3"
     assert rows[0]["zone_host_url"].startswith("https://eu.justbeamit.com")
     assert rows[0]["zone_referrer_url"] == "https://justbeamit.com/"
     assert "zone_identifier_raw" in rows[0]
     assert "ZoneTransfer" in rows[0]["zone_identifier_raw"]
+
+
+def test_mftecmd_conversion_without_events_leaves_no_temp_file(tmp_path):
+    """Conversions that produce no timeline rows clean up their temp file."""
+
+    csv_path = Path(tmp_path) / "sample.csv"
+    csv_path.write_text(
+        "EntryNumber,FileName,FileCreated0x10\n1,empty.txt,\n",
+        encoding="utf-8",
+    )
+
+    converted_path, count = _convert_mftecmd_csv_to_timesketch(str(csv_path))
+    assert converted_path is None
+    assert count == 0
+    assert sorted(os.listdir(tmp_path)) == ["sample.csv"]
+
+
+def test_parse_zone_identifier_contents_handles_line_endings():
+    """Escaped and raw line breaks both split Zone.Identifier entries."""
+
+    parsed = mftecmd_task._parse_zone_identifier_contents(
+        '"[ZoneTransfer]\\r\\nZoneId=3\r\n  HostUrl = https://example.com/a=b \\nnot a pair\nLastWriterPackageFamilyName=App"'
+    )
+    assert parsed == {
+        "zoneid": "3",
+        "hosturl": "https://example.com/a=b",
+        "lastwriterpackagefamilyname": "App",
+    }
+    assert mftecmd_task._parse_zone_identifier_contents("") == {}
+
+
+@pytest.mark.parametrize(
+    "raw_value, expected",
+    [
+        ("2024-02-13 16:39:06.1234567", "2024-02-13T16:39:06+0000"),
+        ("2024-02-13T16:39:06.000Z", "2024-02-13T16:39:06+0000"),
+        ("2024-02-13 16:39:06+02:00", "2024-02-13T14:39:06+0000"),
+        ("2024-02-13 16:39:06-0530", "2024-02-13T22:09:06+0000"),
+        ("2024-02-13", "2024-02-13T00:00:00+0000"),
+        ("2024-13-01 00:00:00", None),
+        ("\u0662024-02-13 16:39:06", "2024-02-13T16:39:06+0000"),
+        ("not a timestamp", None),
+    ],
+)
+def test_normalize_timestamp(raw_value, expected):
+    """Timestamps are converted to UTC in Timesketch's datetime format."""
+
+    assert mftecmd_task._normalize_timestamp(raw_value) == expected
+
+
+def test_mftecmd_timesketch_conversion_in_daemonic_process(monkeypatch, tmp_path):
+    """Every CSV is converted in-process when running as a daemonic Celery child."""
+
+    def _fake(**kwargs):
+        output_files = []
+        for name in ("first", "second"):
+            output_file = create_output_file(
+                output_base_path=kwargs["output_path"],
+                display_name=name,
+                extension="csv",
+                data_type="text/csv",
+            )
+            with open(output_file.path, "w", encoding="utf-8") as fh:
+                fh.write(
+                    "EntryNumber,FileName,FileCreated0x10\n"
+                    "1,a.txt,2025-01-01 12:00:00\n"
+                )
+            output_files.append(output_file.to_dict())
+        return create_task_result(
+            output_files=output_files,
+            workflow_id=kwargs["workflow_id"],
+            command="stub",
+            meta={},
+        )
+
+    monkeypatch.setattr(mftecmd_task, "_run_ez_tool", _fake)
+    context = multiprocessing.get_context("fork")
+    results = context.Queue()
+
+    def _run_task():
+        assert multiprocessing.current_process().daemon
+        results.put(
+            mftecmd_task.mftecmd_command.run(
+                pipe_result=None,
+                input_files=[{"path": "/tmp/$MFT", "display_name": "$MFT"}],
+                output_path=str(tmp_path),
+                workflow_id="wf-daemon",
+                task_config={"output_format": "csv", "timesketch_ready_csv": True},
+            )
+        )
+
+    worker = context.Process(target=_run_task, daemon=True)
+    worker.start()
+    result = results.get(timeout=60)
+    worker.join(timeout=60)
+    assert worker.exitcode == 0
+
+    output_files = _decode_result(result)["output_files"]
+    assert [meta["display_name"] for meta in output_files] == [
+        "first_timesketch.csv",
+        "second_timesketch.csv",
+    ]
+    for output_meta in output_files:
+        with open(output_meta["path"], encoding="utf-8", newline="") as fh:
+            rows = list(csv.DictReader(fh))
+        assert len(rows) == 1
+    assert not [name for name in os.listdir(tmp_path) if name.startswith(".timesketch_")]
+
+
+def test_mftecmd_timesketch_without_csv_returns_result_unchanged(monkeypatch):
+    """Results without CSV outputs are passed through without re-encoding."""
+
+    stub_result = create_task_result(
+        output_files=[{"path": "/tmp/output/out.json", "display_name": "out.json"}],
+        workflow_id="wf-000",
+        command="stub",
+        meta={},
+    )
+    monkeypatch.setattr(mftecmd_task, "_run_ez_tool", lambda **kwargs: stub_result)
+
+    def _fail_encode(_):
+        raise AssertionError("result should not be re-encoded")
+
+    monkeypatch.setattr(mftecmd_task, "encode_dict_to_base64", _fail_encode)
+
+    result = mftecmd_task.mftecmd_command.run(
+        pipe_result=None,
+        input_files=[{"path": "/tmp/$MFT", "display_name": "$MFT"}],
+        output_path="/tmp/output",
+        workflow_id="wf-000",
+        task_config={"output_format": "csv", "timesketch_ready_csv": True},
+    )
+
+    assert result is stub_result
+
+
+def test_mftecmd_extra_attributes_exclude_own_timestamp(tmp_path):
+    """Each event's extras match json.dumps and omit its own timestamp column."""
+
+    csv_path = Path(tmp_path) / "sample.csv"
+    csv_path.write_text(
+        "EntryNumber,FileName,Extension,Created0x10,Created0x30\n"
+        "7,café.txt,é\\\"x,2024-01-01 00:00:00,2024-01-02 00:00:00\n",
+        encoding="utf-8",
+    )
+
+    converted_path, count = _convert_mftecmd_csv_to_timesketch(str(csv_path))
+    assert count == 2
+
+    with open(converted_path, encoding="utf-8", newline="") as fh:
+        rows = list(csv.DictReader(fh))
+
+    assert rows[0]["extra_attributes"] == json.dumps(
+        {"Extension": "é\\\"x", "Created0x30": "2024-01-02 00:00:00"}
+    )
+    assert rows[1]["extra_attributes"] == json.dumps(
+        {"Extension": "é\\\"x", "Created0x10": "2024-01-01 00:00:00"}
+    )
+
+
+@pytest.mark.parametrize(
+    "column_name, expected",
+    [
+        ("FileCreated0x10", "MFTECmd $STANDARD_INFORMATION - Created"),
+        ("EntryModified0x30", "MFTECmd $FILE_NAME - Entry Modified"),
+        ("Modified0x10", "MFTECmd $STANDARD_INFORMATION - Modified"),
+        ("Accessed", "MFTECmd MFTECmd - Accessed"),
+        ("LastRecordChange0x30", "MFTECmd $FILE_NAME - LastRecordChange0x30"),
+    ],
+)
+def test_describe_mft_timestamp(column_name, expected):
+    """Timestamp columns map to attribute/action descriptions."""
+
+    assert mftecmd_task._describe_mft_timestamp(column_name) == expected
+
+
+def test_mftecmd_conversion_tolerates_rejected_chmod(monkeypatch, tmp_path):
+    """Copying the source file mode is best-effort."""
+
+    csv_path = Path(tmp_path) / "sample.csv"
+    csv_path.write_text(
+        "EntryNumber,FileName,FileCreated0x10\n1,a.txt,2025-01-01 12:00:00\n",
+        encoding="utf-8",
+    )
+
+    def _reject_chmod(*_args, **_kwargs):
+        raise PermissionError("chmod not permitted")
+
+    monkeypatch.setattr(mftecmd_task.shutil, "copymode", _reject_chmod)
+
+    converted_path, count = _convert_mftecmd_csv_to_timesketch(str(csv_path))
+
+    assert count == 1
+    assert os.path.dirname(converted_path) == str(tmp_path)
+    os.remove(converted_path)
+
+
+def test_mftecmd_conversion_failure_closes_temp_file(monkeypatch, tmp_path):
+    """A failure while writing neither leaks the temp file nor its descriptor."""
+
+    csv_path = Path(tmp_path) / "sample.csv"
+    csv_path.write_text(
+        "EntryNumber,FileName,FileCreated0x10\n1,a.txt,2025-01-01 12:00:00\n",
+        encoding="utf-8",
+    )
+
+    def _broken_writer(*_args, **_kwargs):
+        raise csv.Error("writer unavailable")
+
+    monkeypatch.setattr(mftecmd_task.csv, "writer", _broken_writer)
+    open_fds_before = len(os.listdir("/proc/self/fd"))
+
+    converted_path, count = _convert_mftecmd_csv_to_timesketch(str(csv_path))
+
+    assert (converted_path, count) == (None, 0)
+    assert sorted(os.listdir(tmp_path)) == ["sample.csv"]
+    assert len(os.listdir("/proc/self/fd")) == open_fds_before